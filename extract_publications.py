@@ -0,0 +1,61 @@
+import re
+import sys
+
+from openpyxl import load_workbook
+
+# Collapse runs of whitespace (including newlines inside cells) to one space
+_WS_RE = re.compile(r'\s+')
+
+# One translate pass replaces the old chain of str.replace calls: drop NULs,
+# turn form-feeds/vertical-tabs into spaces, straighten smart quotes/dashes.
+_CLEAN_TABLE = str.maketrans({
+    '\x00': None,
+    '\x0c': ' ',
+    '\x0b': ' ',
+    '“': '"',
+    '”': '"',
+    '–': '-',
+    '—': '-',
+})
+
+
+def _clean_text(text):
+    """Normalize cell text: drop control characters, straighten smart quotes/dashes."""
+    if text is None:
+        return ''
+    text = str(text).translate(_CLEAN_TABLE)
+    return _WS_RE.sub(' ', text).strip()
+
+
+def extract_publications(excel_file='data/publications.xlsx',
+                         output_file='data/publications.txt',
+                         sample_lines=20):
+    """Extract publication rows from the index workbook into a plain text file.
+
+    The workbook is opened in read-only (streaming) mode and every line is
+    written to the output file as soon as it is produced, so peak memory
+    stays independent of sheet size. The first few lines are echoed to
+    stdout as a sample.
+    """
+    wb = load_workbook(excel_file, read_only=True)
+    ws = wb.active
+
+    written = 0
+    with open(output_file, 'w', encoding='utf-8') as f:
+        for row in ws.iter_rows(values_only=True):
+            line = ' | '.join(_clean_text(cell) for cell in row if cell is not None)
+            if not line:
+                continue
+            f.write(line)
+            f.write('\n')
+            if written < sample_lines:
+                print(line)
+            written += 1
+
+    wb.close()
+    print(f"\nExtracted {written} lines to {output_file}")
+    return written
+
+
+if __name__ == '__main__':
+    extract_publications(*sys.argv[1:3])
@@ -0,0 +1,190 @@
+"""Extract full text, tables and text chunks from the publication PDFs."""
+
+import json
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+import pdfplumber
+
+
+class PDFContentExtractor:
+    """Pulls text content out of the stored publication PDFs."""
+
+    def __init__(self, pdf_directory='data/Publications'):
+        self.pdf_directory = Path(pdf_directory)
+        self.chunk_size = 1000
+        self.chunk_overlap = 200
+
+    def extract_pdf_content(self, pdf_path):
+        """Extract text, tables and chunks from a single PDF."""
+        # One clock read per paper; reused for every table entry below.
+        ts = datetime.utcnow().isoformat()
+        result = {
+            'file_path': str(pdf_path),
+            'extraction_timestamp': ts,
+            'extraction_success': False,
+        }
+        try:
+            with pdfplumber.open(pdf_path) as pdf:
+                text_content = self._extract_text_content(pdf)
+                tables = self._extract_tables(pdf, ts)
+            result.update({
+                'text_content': text_content,
+                'tables': tables,
+                'summary': {
+                    'total_pages': len(text_content['pages']),
+                    'total_words': text_content['total_words'],
+                    'total_chunks': len(text_content['text_chunks']),
+                    'total_tables': len(tables),
+                },
+                'extraction_success': True,
+            })
+        except Exception as e:
+            result['error'] = str(e)
+        return result
+
+    def _extract_text_content(self, pdf):
+        pages = []
+        total_words = 0
+        for page_number, page in enumerate(pdf.pages, start=1):
+            try:
+                text = page.extract_text() or ''
+            except Exception:
+                text = ''
+            words = text.split()
+            total_words += len(words)
+            pages.append({
+                'page_number': page_number,
+                'text': text,
+                'word_count': len(words),
+            })
+        full_text = '\n'.join(p['text'] for p in pages)
+        return {
+            'pages': pages,
+            'full_text': full_text,
+            'total_words': total_words,
+            'text_chunks': self._split_into_chunks(full_text),
+        }
+
+    def _split_into_chunks(self, text):
+        chunks = []
+        start = 0
+        while start < len(text):
+            end = min(start + self.chunk_size, len(text))
+            chunk = text[start:end].strip()
+            if chunk:
+                chunks.append({
+                    'chunk_index': len(chunks),
+                    'text': chunk,
+                    'word_count': len(chunk.split()),
+                })
+            if end == len(text):
+                break
+            start = end - self.chunk_overlap
+        return chunks
+
+    def _extract_tables(self, pdf, ts):
+        tables = []
+        for page_number, page in enumerate(pdf.pages, start=1):
+            try:
+                page_tables = page.extract_tables() or []
+            except Exception:
+                continue
+            for table in page_tables:
+                tables.append({
+                    'page_number': page_number,
+                    'rows': table,
+                    'extracted_at': ts,
+                })
+        return tables
+
+    def process_papers_from_json(self, papers_file='data/mongodb_papers_clean.json',
+                                 output_file='data/papers_with_content.jsonl',
+                                 max_workers=None):
+        """Extract content for every paper with a located PDF.
+
+        Extraction runs in a ProcessPoolExecutor while a background writer
+        thread drains completed papers from a bounded queue and streams them
+        to a JSON-lines file. The bounded queue backpressures extraction if
+        the writer falls behind, so memory stays flat regardless of corpus
+        size.
+        """
+        with open(papers_file, encoding='utf-8') as f:
+            papers = json.load(f)
+
+        eligible = [p for p in papers if p.get('file_found') and p.get('file_path')]
+        print(f"Extracting content for {len(eligible)} of {len(papers)} papers")
+
+        results_queue = queue.Queue(maxsize=32)
+        writer = threading.Thread(target=self._write_results,
+                                  args=(results_queue, output_file))
+        writer.start()
+
+        processed = 0
+        run_ts = datetime.utcnow().isoformat()
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(_extract_one, p['file_path']): p
+                           for p in eligible}
+                for future in as_completed(futures):
+                    paper = dict(futures[future])
+                    content = future.result()
+                    paper['pdf_content'] = content
+                    paper['content_extracted'] = content.get('extraction_success', False)
+                    paper['content_extraction_timestamp'] = run_ts
+                    results_queue.put(paper)
+                    processed += 1
+        finally:
+            results_queue.put(None)
+            writer.join()
+
+        print(f"Wrote {processed} papers to {output_file}")
+        return processed
+
+    @staticmethod
+    def _write_results(results_queue, output_file):
+        with open(output_file, 'w', encoding='utf-8') as f:
+            while True:
+                paper = results_queue.get()
+                if paper is None:
+                    break
+                f.write(json.dumps(paper, ensure_ascii=False))
+                f.write('\n')
+
+    def import_papers(self, papers_file='data/papers_with_content.jsonl',
+                      mongodb_uri='mongodb://localhost:27017/'):
+        """Import extracted papers into MongoDB."""
+        from pymongo import MongoClient
+
+        client = MongoClient(mongodb_uri)
+        collection = client['UBRI_Publication']['Papers']
+
+        imported = 0
+        with open(papers_file, encoding='utf-8') as f:
+            for line in f:
+                paper = json.loads(line)
+                collection.insert_one(self._prepare_paper_document(paper))
+                imported += 1
+
+        print(f"Imported {imported} papers")
+        return imported
+
+    def _prepare_paper_document(self, paper):
+        # import_papers drops its reference after insert, so mutating the
+        # incoming dict is safe and avoids rebuilding the (large) document.
+        paper.pop('_id', None)
+        paper['imported_at'] = datetime.utcnow()
+        return paper
+
+
+def _extract_one(pdf_path):
+    # Module-level so it is picklable for the process pool.
+    return PDFContentExtractor().extract_pdf_content(pdf_path)
+
+
+if __name__ == '__main__':
+    extractor = PDFContentExtractor()
+    extractor.process_papers_from_json()
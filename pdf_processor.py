@@ -0,0 +1,439 @@
+"""Process the publications Excel index and extract text from the PDFs."""
+
+import bisect
+import functools
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import fitz  # PyMuPDF
+import pandas as pd
+from pymongo import MongoClient
+
+try:
+    from rapidfuzz import fuzz
+    from rapidfuzz import process as rf_process
+except ImportError:
+    rf_process = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# One compiled alternation finds every section heading in a single C-level
+# scan of the document; the map folds alternative spellings onto canonical
+# section names.
+_SECTION_RE = re.compile(
+    r'(?im)^\s*(?P<name>abstract|summary|introduction|intro|methods|'
+    r'methodology|results|findings|discussion|conclusion|references|'
+    r'bibliography|citations)\b')
+
+_SECTION_CANONICAL = {
+    'abstract': 'abstract', 'summary': 'abstract',
+    'introduction': 'introduction', 'intro': 'introduction',
+    'methods': 'methods', 'methodology': 'methods',
+    'results': 'results', 'findings': 'results',
+    'discussion': 'discussion', 'conclusion': 'discussion',
+    'references': 'references', 'bibliography': 'references',
+    'citations': 'references',
+}
+
+
+# Sentence-terminating punctuation followed by whitespace (or end of text).
+_SENT_END = re.compile(r'[.!?](?=\s|$)')
+
+# Single-pass equivalent of the old chain of str.replace calls.
+_CLEAN_TABLE = str.maketrans({
+    '\x00': '',
+    '\x0c': ' ',
+    '\x0b': ' ',
+    '“': '"',
+    '”': '"',
+    '–': '-',
+    '—': '-',
+})
+
+
+class PDFProcessor:
+    """Extracts and structures text from a single PDF."""
+
+    @classmethod
+    def extract_batch(cls, paths, max_workers=None):
+        """Extract a batch of PDFs across worker processes.
+
+        PDF parsing is CPU-bound, so one worker per core gives near-linear
+        speedup on corpus-wide ingest; chunksize amortizes the IPC cost.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_extract_one, paths, chunksize=4))
+
+    def extract_text_from_pdf(self, pdf_path, max_pages=None,
+                              include_metadata=False):
+        """Extract text (and optionally metadata) in a single parse.
+
+        Metadata is off by default: text-only callers skip it entirely,
+        and when requested it comes from the same fitz handle, so the PDF
+        is never opened or parsed a second time.
+        """
+        pages_text = []
+        num_pages = 0
+        metadata = None
+        doc = fitz.open(pdf_path)
+        try:
+            if include_metadata:
+                metadata = dict(doc.metadata or {})
+                metadata['num_pages'] = doc.page_count
+            for page_number, text in _iter_doc_pages(doc):
+                if max_pages is not None and page_number > max_pages:
+                    break
+                pages_text.append(text)
+                num_pages = page_number
+        finally:
+            doc.close()
+        full_text = self.clean_text('\n'.join(pages_text))
+        result = {
+            'file_path': str(pdf_path),
+            'num_pages': num_pages,
+            'full_text': full_text,
+            'sections': self.extract_sections(pages_text),
+            'chunks': self.split_into_chunks(full_text),
+        }
+        if include_metadata:
+            result['metadata'] = metadata
+        return result
+
+    def iter_pages(self, pdf_path):
+        """Yield (page_number, text) pairs one page at a time.
+
+        PyMuPDF's C-backed parser is roughly an order of magnitude faster
+        than the pdfminer-based extractors for plain page text, and the
+        generator form lets callers stream thousand-page PDFs (or stop
+        after the first N pages) without holding every page in memory.
+        """
+        doc = fitz.open(pdf_path)
+        try:
+            yield from _iter_doc_pages(doc)
+        finally:
+            doc.close()
+
+    def _extract_with_pymupdf(self, pdf_path):
+        return [text for _, text in self.iter_pages(pdf_path)]
+
+    def clean_text(self, text):
+        # One translate pass plus one whitespace-collapse pass, both in C;
+        # the old replace chain walked and reallocated the text six times.
+        return ' '.join(text.translate(_CLEAN_TABLE).split())
+
+    def iter_chunks(self, text, chunk_size=1000, overlap=200):
+        """Yield text chunks lazily using a fixed (K, S) sliding window.
+
+        Start offsets are i*S with stride S = chunk_size - overlap, so
+        there is no data-dependent start recurrence to iterate; only each
+        chunk's end is snapped to a nearby sentence boundary.
+        """
+        n = len(text)
+        stride = chunk_size - overlap
+        # Find every sentence end once (a single C-level finditer pass);
+        # each chunk boundary is then a binary search into the sorted
+        # offsets instead of a rescan of its 100-char window.
+        ends = [m.end() for m in _SENT_END.finditer(text)]
+        for start in range(0, n, stride):
+            end = min(start + chunk_size, n)
+            if end < n and ends:
+                lo = max(start + chunk_size - 100, start)
+                idx = bisect.bisect_right(ends, end)
+                if idx and ends[idx - 1] > lo:
+                    end = ends[idx - 1]
+            chunk = text[start:end].strip()
+            if chunk:
+                yield chunk
+            if end == n:
+                break
+
+    def split_into_chunks(self, text, chunk_size=1000, overlap=200):
+        return list(self.iter_chunks(text, chunk_size, overlap))
+
+    def extract_sections(self, pages_text):
+        full_text = '\n'.join(pages_text)
+        sections = {}
+        matches = list(_SECTION_RE.finditer(full_text))
+        for match, following in zip(matches, matches[1:] + [None]):
+            name = _SECTION_CANONICAL[match['name'].lower()]
+            end = following.start() if following is not None else len(full_text)
+            # Keep the first occurrence of each section.
+            if name not in sections:
+                sections[name] = full_text[match.end():end].strip()
+        return sections
+
+
+def _iter_doc_pages(doc):
+    for page_number, page in enumerate(doc, start=1):
+        try:
+            text = page.get_text('text').strip()
+        except Exception:
+            # Preserve per-page error isolation: a corrupt page yields an
+            # empty string rather than failing the document.
+            text = ''
+        yield page_number, text
+
+
+def _extract_one(pdf_path):
+    # Module-level so it is picklable for the process pool.
+    return PDFProcessor().extract_text_from_pdf(pdf_path)
+
+
+# Compiled once; these used to be re.sub literals recompiled (via the
+# pattern-cache lookup) for every (title, file) pair.
+_NON_WORD_RE = re.compile(r'[^\w\s-]')
+_NON_WORD_NODASH_RE = re.compile(r'[^\w\s]')
+_DASH_SPACE_RE = re.compile(r'[-\s]+')
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_title_words(title):
+    # The filename loop is the inner loop, so the title-side cleanup is
+    # recomputed for every candidate file without this cache.
+    return frozenset(_NON_WORD_NODASH_RE.sub('', title.lower()).split())
+
+
+# Split on every separator in one compiled scan. The old helpers split on
+# only the first separator found, which mis-parsed values mixing ';' and ','.
+_AUTHOR_SPLIT = re.compile(r';|\s+and\s+|\s*&\s*|,')
+_KEYWORD_SPLIT = re.compile(r'[;,|]')
+
+
+def _stem_words(pdf_path):
+    clean = _NON_WORD_NODASH_RE.sub(
+        '', pdf_path.stem.lower().replace('_', ' ').replace('-', ' '))
+    return frozenset(clean.split())
+
+
+class ExcelIndexProcessor:
+    """Converts the publications Excel index into MongoDB-ready documents."""
+
+    def __init__(self, excel_file='data/publications.xlsx',
+                 publications_dir='data/Publications'):
+        self.excel_file = Path(excel_file)
+        self.publications_dir = Path(publications_dir)
+        self.processed_data = []
+        self._all_pdfs = None
+        self._pdfs_by_univ = {}
+
+    def _build_pdf_index(self):
+        """Walk the publications tree once and group PDFs by university.
+
+        find_pdf_file used to rglob the whole tree (twice) for every title,
+        i.e. O(titles x files) filesystem walks; with the index the walk
+        happens once and matching is in-memory.
+        """
+        self._all_pdfs = list(self.publications_dir.rglob('*.pdf'))
+        self._pdfs_by_univ = {}
+        for pdf_path in self._all_pdfs:
+            rel = pdf_path.relative_to(self.publications_dir)
+            univ = rel.parts[0] if len(rel.parts) > 1 else ''
+            self._pdfs_by_univ.setdefault(univ, []).append(pdf_path)
+        # Matching corpora for rapidfuzz: filename stems as plain words.
+        self._pdf_names = [p.stem.replace('_', ' ') for p in self._all_pdfs]
+        self._univ_names = {
+            univ: [p.stem.replace('_', ' ') for p in paths]
+            for univ, paths in self._pdfs_by_univ.items()
+        }
+        # Pre-split word sets for the fallback matcher, so a lookup is a
+        # C-level set intersection per file with no regex work at all.
+        self._pdf_words = [_stem_words(p) for p in self._all_pdfs]
+        self._univ_words = {
+            univ: [_stem_words(p) for p in paths]
+            for univ, paths in self._pdfs_by_univ.items()
+        }
+
+    def read_excel_file(self):
+        # dtype=str skips per-column type inference and
+        # keep_default_na=False skips NaN substitution for strings - the
+        # string columns get fillna('') in clean_data anyway.
+        df = pd.read_excel(self.excel_file, engine='openpyxl', dtype=str,
+                           keep_default_na=False)
+        print(f"Read {len(df)} rows from {self.excel_file}")
+        return df
+
+    def clean_data(self, df):
+        df = df.copy()
+        df.columns = [str(c).strip().lower().replace(' ', '_') for c in df.columns]
+        for col in ('title', 'authors', 'university', 'journal', 'keywords'):
+            if col in df.columns:
+                df[col] = df[col].fillna('')
+        return df
+
+    def find_pdf_file(self, title, university):
+        if not title:
+            return None
+        # First guess: a file named after the cleaned title.
+        clean = _NON_WORD_RE.sub('', title.lower()).strip()
+        clean = _DASH_SPACE_RE.sub('_', clean)
+        if self._all_pdfs is None:
+            self._build_pdf_index()
+        if university:
+            candidate = self.publications_dir / university / f'{clean}.pdf'
+            if candidate.exists():
+                return str(candidate)
+        # Prefer the university's own PDFs, then fall back to the full set.
+        if rf_process is not None:
+            # rapidfuzz runs the whole corpus comparison in C instead of a
+            # Python set intersection per file.
+            for paths, names in (
+                    (self._pdfs_by_univ.get(university, []),
+                     self._univ_names.get(university, [])),
+                    (self._all_pdfs, self._pdf_names)):
+                if not names:
+                    continue
+                match = rf_process.extractOne(
+                    title, names, scorer=fuzz.token_set_ratio, score_cutoff=60)
+                if match is not None:
+                    return str(paths[match[2]])
+            return None
+        title_words = _clean_title_words(title)
+        if not title_words:
+            return None
+        threshold = min(3, max(1, len(title_words) // 2))
+        for paths, word_sets in (
+                (self._pdfs_by_univ.get(university, []),
+                 self._univ_words.get(university, [])),
+                (self._all_pdfs, self._pdf_words)):
+            for pdf_path, file_words in zip(paths, word_sets):
+                if len(title_words & file_words) >= threshold:
+                    return str(pdf_path)
+        return None
+
+    def _title_matches_file(self, title, filename):
+        title_words = _clean_title_words(title)
+        clean_name = _NON_WORD_NODASH_RE.sub(
+            '', filename.lower().replace('_', ' ').replace('-', ' '))
+        if not title_words:
+            return False
+        overlap = title_words & set(clean_name.split())
+        return len(overlap) >= min(3, max(1, len(title_words) // 2))
+
+    def _parse_authors(self, authors_str):
+        if not isinstance(authors_str, str) or not authors_str.strip() \
+                or authors_str.lower() == 'nan':
+            return []
+        return [a.strip() for a in _AUTHOR_SPLIT.split(authors_str)
+                if a and a.strip()]
+
+    def _parse_keywords(self, keywords_str):
+        if not isinstance(keywords_str, str) or not keywords_str.strip() \
+                or keywords_str.lower() == 'nan':
+            return []
+        return [k.strip() for k in _KEYWORD_SPLIT.split(keywords_str)
+                if k and k.strip()]
+
+    def convert_to_mongodb_format(self, df):
+        # Split authors/keywords for the whole frame in one vectorized pass
+        # (dispatches to compiled re) instead of a per-row separator scan.
+        if 'authors' in df.columns:
+            df['_authors_list'] = (
+                df['authors'].fillna('').astype(str)
+                .str.split(r';|\s+and\s+|\s*&\s*|,', regex=True)
+                .apply(lambda xs: [x.strip() for x in xs if x and x.strip()]))
+        if 'keywords' in df.columns:
+            df['_keywords_list'] = (
+                df['keywords'].fillna('').astype(str)
+                .str.split(r'[;,|]', regex=True)
+                .apply(lambda xs: [x.strip() for x in xs if x and x.strip()]))
+
+        # Clean the year column in one vectorized pass; the loop then just
+        # indexes, with no pd.notna dispatch or double dict lookup per row.
+        if 'year' in df.columns:
+            # Cells arrive as strings under dtype=str; blanks mean no year.
+            years = [int(float(y)) if str(y).strip() not in ('', 'nan') else None
+                     for y in df['year'].tolist()]
+        else:
+            years = [None] * len(df)
+
+        documents = []
+        # to_dict(orient='records') hands back plain dicts in one shot;
+        # iterrows built a Series (with per-cell dtype inference) per row.
+        # Naive datetime: orjson (and pymongo) serialize it natively, so no
+        # per-document isoformat string build is needed.
+        now = datetime.utcnow()
+        source_file = str(self.excel_file)
+        for index, rec in enumerate(df.to_dict(orient='records')):
+            title = str(rec.get('title', '') or '')
+            university = str(rec.get('university', '') or '')
+            pdf_path = self.find_pdf_file(title, university)
+            documents.append({
+                'paper_id': f'paper_{index}',
+                'title': title,
+                'authors': rec.get('_authors_list') or [],
+                'university': university,
+                'year': years[index],
+                'journal': rec.get('journal', ''),
+                'keywords': rec.get('_keywords_list') or [],
+                'file_path': pdf_path,
+                'file_found': pdf_path is not None,
+                'source_file': source_file,
+                'created_at': now,
+                'updated_at': now,
+                'metadata': {
+                    'row_index': index,
+                },
+            })
+        self.processed_data = documents
+        return documents
+
+    def save_to_json(self, output_file='data/mongodb_papers_clean.json'):
+        if orjson is not None:
+            Path(output_file).write_bytes(orjson.dumps(
+                self.processed_data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(self.processed_data, f, indent=2, ensure_ascii=False,
+                          default=str)
+        print(f"Saved {len(self.processed_data)} documents to {output_file}")
+
+    def save_to_mongo(self, collection=None, batch_size=1000):
+        """Insert the converted documents in batches via insert_many.
+
+        One wire-protocol batch per 1000 documents instead of N insert
+        round-trips; ordered=False lets the server keep going past
+        individual failures.
+        """
+        if collection is None:
+            collection = get_mongo_client()['UBRI_Publication']['Papers']
+        docs = self.processed_data
+        inserted = 0
+        for i in range(0, len(docs), batch_size):
+            result = collection.insert_many(docs[i:i + batch_size],
+                                            ordered=False,
+                                            bypass_document_validation=True)
+            inserted += len(result.inserted_ids)
+        print(f"Inserted {inserted} documents")
+        return inserted
+
+    def process_index(self):
+        df = self.clean_data(self.read_excel_file())
+        documents = self.convert_to_mongodb_format(df)
+        found = sum(1 for d in documents if d['file_found'])
+        print(f"Matched {found} of {len(documents)} titles to PDF files")
+        self.save_to_json()
+        return documents
+
+
+@functools.lru_cache(maxsize=1)
+def get_mongo_client():
+    """Shared, lazily-created MongoClient (thread-safe, pools connections)."""
+    return MongoClient(os.environ.get('UBRI_MONGO_URI',
+                                      'mongodb://localhost:27017/'),
+                       maxPoolSize=50)
+
+
+if __name__ == '__main__':
+    # Smoke check only when run as a script; importing this module (e.g.
+    # from process-pool workers, which re-import it per worker) must stay
+    # free of network round-trips.
+    print(list(get_mongo_client()['UBRI_Publication']['Papers'].find()))
@@ -0,0 +1,107 @@
+"""Build a lightweight index of the publication PDFs (no text extraction)."""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class SimplePaperProcessor:
+    """Indexes the PDF directory with per-file metadata only."""
+
+    def __init__(self, pdf_directory='data/Publications',
+                 output_file='data/papers_index.json'):
+        self.pdf_directory = Path(pdf_directory)
+        self.output_file = Path(output_file)
+        self.processed_data = []
+
+    def find_pdf_files(self):
+        # os.scandir returns DirEntry objects whose stat() result is cached
+        # from the directory read, so no Path object or extra syscall per
+        # file is needed.
+        with os.scandir(self.pdf_directory) as it:
+            pdf_files = [entry for entry in it
+                         if entry.is_file() and entry.name.endswith('.pdf')]
+        print(f"Found {len(pdf_files)} PDF files")
+        return pdf_files
+
+    def extract_basic_info(self, entry):
+        try:
+            stat = entry.stat()
+            return {
+                'filename': entry.name,
+                'file_path': entry.path,
+                'file_size': stat.st_size,
+                'modified_at': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                'status': 'pending',
+            }
+        except OSError as e:
+            return {
+                'filename': entry.name,
+                'file_path': entry.path,
+                'status': 'error',
+                'error': str(e),
+            }
+
+    def process_all_papers(self):
+        pdf_files = self.find_pdf_files()
+        # Threads are enough here: per-file work is a stat() which releases
+        # the GIL, and the serial loop is I/O-bound on cold/networked
+        # filesystems. extract_basic_info never raises, so map is robust.
+        max_workers = min(32, (os.cpu_count() or 4) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            self.processed_data = list(
+                executor.map(self.extract_basic_info, pdf_files, chunksize=16))
+        return self.processed_data
+
+    def generate_summary(self):
+        # Single pass; the old list comprehensions walked the data four
+        # times to answer three questions.
+        successful = failed = total_size = 0
+        for p in self.processed_data:
+            status = p.get('status')
+            successful += status == 'pending'
+            failed += status == 'error'
+            total_size += p.get('file_size') or 0
+        return {
+            'total_papers': len(self.processed_data),
+            'successful': successful,
+            'failed': failed,
+            'total_size_bytes': total_size,
+            'generated_at': datetime.utcnow().isoformat(),
+        }
+
+    def save_results(self, pretty=False):
+        # orjson serializes in C and writes bytes directly; keep the stdlib
+        # path as a fallback when it is not installed. Pretty-printing is
+        # opt-in: compact output is ~2x faster to encode and nobody reads
+        # the bulk index by hand.
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            with open(self.output_file, 'wb') as f:
+                f.write(orjson.dumps(self.processed_data, option=option))
+        else:
+            with open(self.output_file, 'w', encoding='utf-8') as f:
+                if pretty:
+                    json.dump(self.processed_data, f, indent=2, ensure_ascii=False)
+                else:
+                    json.dump(self.processed_data, f, ensure_ascii=False,
+                              separators=(',', ':'))
+        print(f"Saved {len(self.processed_data)} entries to {self.output_file}")
+
+
+def main():
+    processor = SimplePaperProcessor()
+    processor.process_all_papers()
+    print(json.dumps(processor.generate_summary(), indent=2))
+    processor.save_results()
+
+
+if __name__ == '__main__':
+    main()
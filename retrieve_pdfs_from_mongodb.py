@@ -0,0 +1,283 @@
+"""Retrieve stored publication PDFs from MongoDB GridFS."""
+
+import functools
+import hashlib
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import gridfs
+from pymongo import MongoClient
+from pymongo.errors import OperationFailure
+
+# Keep credentials out of source; point UBRI_MONGO_URI at the deployment.
+MONGODB_URI = os.environ.get('UBRI_MONGO_URI', 'mongodb://localhost:27017/')
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(mongodb_uri):
+    """Shared MongoClient per URI; avoids a TLS handshake per instance.
+
+    Reads are served from secondaries when available, which keeps bulk
+    GridFS downloads off the primary.
+    """
+    return MongoClient(
+        mongodb_uri,
+        maxPoolSize=64,
+        minPoolSize=8,
+        compressors='zstd,snappy',
+        readPreference='secondaryPreferred',
+        retryReads=True,
+    )
+
+
+class PDFRetriever:
+    """Downloads and inspects PDFs stored in the pdf_files GridFS bucket."""
+
+    def __init__(self, mongodb_uri=None, database_name='UBRI_Publication'):
+        mongodb_uri = mongodb_uri or MONGODB_URI
+        self._mongodb_uri = mongodb_uri
+        self._database_name = database_name
+        self.client = _get_client(mongodb_uri)
+        self.db = self.client[database_name]
+        self.fs = gridfs.GridFS(self.db, collection='pdf_files')
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        # Idempotent; gives title/university lookups an index to use
+        # instead of an unanchored $regex collection scan.
+        try:
+            self.db.pdf_files.files.create_index(
+                [('metadata.paper_title', 'text'), ('metadata.university', 'text')])
+            self.db.pdf_files.files.create_index('metadata.university')
+            # Covers get_storage_stats: the aggregation can be answered
+            # from the index alone, with no document fetches.
+            self.db.pdf_files.files.create_index(
+                [('metadata.university', 1), ('metadata.year', 1), ('length', 1)],
+                name='covering_stats')
+            self._stats_hint = 'covering_stats'
+        except Exception as e:
+            # Index creation is best-effort; remember that the covering
+            # index may be absent so queries don't hint a missing index.
+            self._stats_hint = None
+            print(f"Warning: could not create indexes: {e}")
+
+    def retrieve_pdf_by_id(self, file_id, output_dir='data/retrieved'):
+        """Download a single PDF to output_dir, streaming in 1 MiB chunks."""
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        return self._retrieve_pdf_to(file_id, output_path)
+
+    def _retrieve_pdf_to(self, file_id, output_path):
+        # output_path is an already-created Path; batch callers create the
+        # directory once instead of paying a mkdir syscall per file.
+        grid_out = self.fs.get(file_id)
+        target = output_path / grid_out.filename
+        with open(target, 'wb') as f:
+            shutil.copyfileobj(grid_out, f, length=1024 * 1024)
+        print(f"Retrieved {grid_out.filename} -> {target}")
+        return target
+
+    def retrieve_pdf_by_title(self, title, output_dir='data/retrieved', exact=True):
+        if exact:
+            doc = self.db.pdf_files.files.find_one({'metadata.paper_title': title})
+        else:
+            # Fuzzy mode: anchored prefix regex so the title index can
+            # still bound the scan.
+            doc = self.db.pdf_files.files.find_one(
+                {'metadata.paper_title': {'$regex': f'^{re.escape(title)}',
+                                          '$options': 'i'}})
+        if doc is None:
+            print(f"No stored PDF matches title: {title}")
+            return None
+        return self.retrieve_pdf_by_id(doc['_id'], output_dir)
+
+    def retrieve_pdfs_by_university(self, university, output_dir='data/retrieved'):
+        # Exact match first (indexed); only fall back to a regex scan when
+        # nothing matches verbatim.
+        docs = list(self.db.pdf_files.files.find(
+            {'metadata.university': university}))
+        if not docs:
+            docs = list(self.db.pdf_files.files.find(
+                {'metadata.university': {'$regex': f'^{re.escape(university)}',
+                                         '$options': 'i'}}))
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        retrieved = []
+        for doc in docs:
+            retrieved.append(self._retrieve_pdf_to(doc['_id'], output_path))
+        print(f"Retrieved {len(retrieved)} PDFs for {university}")
+        return retrieved
+
+    async def retrieve_pdfs_by_university_async(self, university,
+                                                output_dir='data/retrieved',
+                                                max_concurrency=8):
+        """Download a university's PDFs concurrently via motor + asyncio.
+
+        Downloads are network-bound and independent, so running them under
+        a Semaphore-capped asyncio.gather turns N sequential round trips
+        into ~N/max_concurrency overlapped ones.
+        """
+        import asyncio
+
+        import aiofiles
+        from motor.motor_asyncio import (AsyncIOMotorClient,
+                                         AsyncIOMotorGridFSBucket)
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        client = AsyncIOMotorClient(self._mongodb_uri)
+        try:
+            db = client[self._database_name]
+            bucket = AsyncIOMotorGridFSBucket(db, bucket_name='pdf_files')
+            docs = await db.pdf_files.files.find(
+                {'metadata.university': university},
+                projection={'_id': 1, 'filename': 1}).to_list(length=None)
+
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def download(doc):
+                async with semaphore:
+                    stream = await bucket.open_download_stream(doc['_id'])
+                    target = output_path / doc['filename']
+                    async with aiofiles.open(target, 'wb') as f:
+                        while True:
+                            chunk = await stream.read(1024 * 1024)
+                            if not chunk:
+                                break
+                            await f.write(chunk)
+                    return target
+
+            retrieved = await asyncio.gather(*(download(d) for d in docs))
+            print(f"Retrieved {len(retrieved)} PDFs for {university}")
+            return list(retrieved)
+        finally:
+            client.close()
+
+    def retrieve_pdfs_by_university_parallel(self, university,
+                                             output_dir='data/retrieved',
+                                             max_concurrency=8):
+        """Sync wrapper around retrieve_pdfs_by_university_async."""
+        import asyncio
+        return asyncio.run(self.retrieve_pdfs_by_university_async(
+            university, output_dir, max_concurrency))
+
+    # Only these fields are ever read from a listing; querying fs.files
+    # directly with a projection skips GridOut construction entirely.
+    _LIST_PROJECTION = {'_id': 1, 'filename': 1, 'length': 1,
+                        'uploadDate': 1, 'metadata': 1}
+
+    @staticmethod
+    def _file_info(doc):
+        return {
+            'file_id': str(doc['_id']),
+            'filename': doc.get('filename'),
+            'size': doc.get('length'),
+            'upload_date': doc.get('uploadDate'),
+            'metadata': doc.get('metadata') or {},
+        }
+
+    def list_all_stored_files(self, limit=None, skip=0):
+        # Push pagination down to the server so wire bytes scale with the
+        # page size, not the collection size.
+        cursor = self.db.pdf_files.files.find(
+            {}, projection=self._LIST_PROJECTION).skip(skip)
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        return [self._file_info(doc) for doc in cursor]
+
+    def search_files(self, query):
+        cursor = self.db.pdf_files.files.find({'$or': [
+            {'filename': {'$regex': query, '$options': 'i'}},
+            {'metadata.paper_title': {'$regex': query, '$options': 'i'}},
+        ]}, projection=self._LIST_PROJECTION)
+        return [self._file_info(doc) for doc in cursor]
+
+    def _calculate_file_hash(self, file_path):
+        with open(file_path, 'rb') as f:
+            try:
+                # Py 3.11+: hands the whole file to OpenSSL's fast path
+                # (SHA-NI where available) with large buffered reads.
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            except AttributeError:
+                sha256 = hashlib.sha256()
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    sha256.update(chunk)
+                return sha256.hexdigest()
+
+    def verify_file_integrity(self, file_id, original_path):
+        """Compare the stored file's hash against the on-disk original."""
+        # Hash the on-disk original in a worker thread so it overlaps the
+        # network fetch below; wall time becomes max(network, local hash)
+        # instead of their sum.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            original_future = executor.submit(
+                self._calculate_file_hash, Path(original_path))
+            grid_out = self.fs.get(file_id)
+            hasher = hashlib.sha256()
+            # Stream the GridFS download straight into the hash; no
+            # full-file buffer is ever materialized.
+            while chunk := grid_out.read(1024 * 1024):
+                hasher.update(chunk)
+            stored_hash = hasher.hexdigest()
+            original_hash = original_future.result()
+        return stored_hash == original_hash
+
+    def get_storage_stats(self):
+        # One $facet aggregate answers all three group-bys server-side in a
+        # single round trip; no GridOut objects are ever instantiated.
+        pipeline = [{'$facet': {
+            'total': [{'$group': {'_id': None,
+                                  'bytes': {'$sum': '$length'},
+                                  'count': {'$sum': 1}}}],
+            'universities': [
+                {'$group': {'_id': '$metadata.university', 'count': {'$sum': 1}}},
+                {'$sort': {'count': -1}},
+            ],
+            'years': [
+                {'$group': {'_id': '$metadata.year', 'count': {'$sum': 1}}},
+                {'$sort': {'_id': 1}},
+            ],
+        }}]
+        files = self.db.pdf_files.files
+        if self._stats_hint is not None:
+            try:
+                facets = list(files.aggregate(
+                    pipeline, allowDiskUse=False,
+                    hint=self._stats_hint))[0]
+            except OperationFailure:
+                # The hinted index can still vanish between
+                # _ensure_indexes and now (e.g. dropped externally);
+                # retry with whatever plan the server picks.
+                facets = list(files.aggregate(pipeline,
+                                              allowDiskUse=False))[0]
+        else:
+            facets = list(files.aggregate(pipeline, allowDiskUse=False))[0]
+        total = facets['total'][0] if facets['total'] else {'bytes': 0, 'count': 0}
+        return {
+            'total_files': total['count'],
+            'total_size_bytes': total['bytes'],
+            'by_university': facets['universities'],
+            'by_year': facets['years'],
+        }
+
+    def close(self):
+        # The client is shared across instances via _get_client; tearing it
+        # down here would break other retrievers using the same pool.
+        pass
+
+
+def main():
+    retriever = PDFRetriever()
+    files = retriever.list_all_stored_files(limit=10)
+    for info in files:
+        print(f"  {info['filename']} ({info['size']} bytes)")
+    print(retriever.get_storage_stats())
+    retriever.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Run the paper-processing stages from a single entry point.
+
+Stages are imported and called in-process rather than launched with
+subprocess.run([sys.executable, ...]): each fork-exec paid full
+interpreter cold-start plus re-imports of the heavy dependencies
+(pandas, pdfplumber, pymongo) that are already warm here.
+"""
+
+import argparse
+import importlib
+import subprocess
+import sys
+
+
+def _run_stage(module_name, attr, args=()):
+    """Import a stage module lazily and call its entry point in-process."""
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        # Fall back to a subprocess if the module cannot be imported here
+        # (e.g. it hard-requires a dependency this environment lacks).
+        print(f"Cannot import {module_name} ({e}); running as subprocess")
+        result = subprocess.run([sys.executable, f'{module_name}.py'])
+        return result.returncode == 0
+    try:
+        getattr(module, attr)(*args)
+        return True
+    except SystemExit as e:
+        # Preserve CLI exit semantics for stages that sys.exit().
+        return (e.code or 0) == 0
+
+
+def main(argv=None):
+    # Flags instead of interactive prompts: an input() call mid-pipeline
+    # blocks forever under CI/cron and makes end-to-end runs unmeasurable.
+    parser = argparse.ArgumentParser(
+        description='Run the paper-processing pipeline stages in-process.')
+    parser.add_argument('--import-mongo', action=argparse.BooleanOptionalAction,
+                        default=False,
+                        help='import extracted papers into MongoDB afterwards')
+    args = parser.parse_args(argv)
+
+    ok = _run_stage('extract_publications', 'extract_publications')
+    ok = _run_stage('process_papers', 'main') and ok
+
+    content = importlib.import_module('pdf_content_extractor')
+    extractor = content.PDFContentExtractor()
+    extractor.process_papers_from_json()
+
+    if args.import_mongo:
+        extractor.import_papers()
+
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Export paper documents from MongoDB and upload them to Jina in batches."""
+
+import gzip
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+from pymongo import MongoClient
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JINA_ENDPOINT = os.environ.get('JINA_ENDPOINT', 'https://api.jina.ai/v1/documents')
+JINA_API_KEY = os.environ.get('JINA_API_KEY', '')
+MONGODB_URI = os.environ.get('UBRI_MONGO_URI', 'mongodb://localhost:27017/')
+
+BATCH_SIZE = 500
+MAX_CONCURRENT_POSTS = 8
+
+
+def _dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def chunks(cursor, size):
+    """Yield lists of up to `size` documents from a cursor."""
+    batch = []
+    for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def send_batch(session, batch):
+    # Paper metadata JSON is highly compressible (repeated field names,
+    # ASCII); gzip at level 3 trades a little CPU for far fewer wire bytes.
+    body = gzip.compress(_dumps(batch), compresslevel=3)
+    response = session.post(
+        JINA_ENDPOINT,
+        data=body,
+        headers={'Content-Type': 'application/json',
+                 'Content-Encoding': 'gzip'},
+    )
+    response.raise_for_status()
+    return len(batch)
+
+
+def main():
+    client = MongoClient(MONGODB_URI)
+    collection = client['UBRI_Publication']['Papers']
+
+    session = requests.Session()
+    session.headers.update({'Authorization': f'Bearer {JINA_API_KEY}'})
+
+    # Stream the cursor in server-side batches and keep a bounded number of
+    # POSTs in flight, so peak memory is a few batches rather than the
+    # whole collection.
+    sent = 0
+    in_flight = set()
+    cursor = collection.find({}, projection={'_id': 0}).batch_size(1000)
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_POSTS) as executor:
+        for batch in chunks(cursor, BATCH_SIZE):
+            in_flight.add(executor.submit(send_batch, session, batch))
+            if len(in_flight) >= MAX_CONCURRENT_POSTS:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                sent += sum(f.result() for f in done)
+        for future in in_flight:
+            sent += future.result()
+
+    print(f"Uploaded {sent} documents to Jina")
+    client.close()
+
+
+if __name__ == '__main__':
+    main()
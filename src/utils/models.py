@@ -0,0 +1,135 @@
+"""Shared data models for the paper-processing pipeline.
+
+The index-level models (PaperMetadata, ProcessingConfig) are Pydantic v2
+models so their validation runs in pydantic-core (Rust). The per-chunk
+classes, constructed once per text fragment across the whole corpus, are
+slotted dataclasses instead — at that volume validation overhead and the
+per-instance __dict__ both matter more than convenience.
+"""
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import List, Optional, Sequence
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class PaperMetadata(BaseModel):
+    """Index-level metadata for one publication."""
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    paper_id: str
+    title: str
+    authors: List[str] = Field(default_factory=list)
+    university: Optional[str] = None
+    year: Optional[int] = None
+    keywords: List[str] = Field(default_factory=list)
+    file_found: bool = False
+    file_path: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class TextChunk:
+    """One chunk of extracted paper text, sized for embedding.
+
+    The per-chunk classes are slotted dataclasses rather than models:
+    one instance exists per text fragment across the corpus, and slots
+    drop the per-instance __dict__, roughly halving instance memory and
+    avoiding a dict lookup on every attribute access.
+    """
+
+    paper_id: str
+    chunk_index: int
+    text: str
+    section: Optional[str] = None
+    word_count: int = 0
+
+    def to_dict(self):
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+@dataclass(slots=True, frozen=True)
+class VectorChunk:
+    """A text chunk together with its embedding vector.
+
+    The embedding is stored as raw little-endian float16 bytes rather
+    than List[float]: a boxed Python float costs ~28 B against 2 B per
+    component here, so a 768-dim vector shrinks from ~21 KB of scattered
+    objects to a 1.5 KB contiguous buffer.
+    """
+
+    chunk_id: str
+    paper_id: str
+    embedding: bytes
+    model_name: str = ''
+
+    def to_dict(self):
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    @classmethod
+    def from_vector(cls, chunk_id, paper_id, vector, model_name=''):
+        return cls(chunk_id=chunk_id, paper_id=paper_id,
+                   embedding=np.asarray(vector, dtype=np.float16).tobytes(),
+                   model_name=model_name)
+
+    def to_numpy(self):
+        return np.frombuffer(self.embedding, dtype=np.float16)
+
+
+class VectorChunkBatch:
+    """Column-oriented batch of embeddings for similarity search.
+
+    Keeping all vectors in one (N, D) matrix lets cosine similarity run
+    as a single BLAS matrix-vector product instead of N Python-level dot
+    products.
+    """
+
+    def __init__(self, ids: List[str], embeddings: np.ndarray):
+        self.ids = ids
+        self.embeddings = embeddings
+
+    @classmethod
+    def from_chunks(cls, chunks: Sequence['VectorChunk']):
+        ids = [chunk.chunk_id for chunk in chunks]
+        embeddings = np.vstack([chunk.to_numpy() for chunk in chunks])
+        return cls(ids, embeddings)
+
+    def cosine_similarity(self, query):
+        query = np.asarray(query, dtype=np.float32)
+        matrix = self.embeddings.astype(np.float32, copy=False)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+        norms[norms == 0] = 1.0
+        return (matrix @ query) / norms
+
+
+@dataclass(slots=True)
+class ProcessingStatus:
+    """Outcome of one pipeline stage for one paper."""
+
+    paper_id: str
+    stage: str
+    success: bool = True
+    error: Optional[str] = None
+    processed_at: datetime = field(default_factory=datetime.utcnow)
+
+    def to_dict(self):
+        return asdict(self)
+
+
+class ProcessingConfig(BaseModel):
+    """Tunables shared by the extraction and storage stages."""
+
+    chunk_size: int = 1000
+    chunk_overlap: int = 100
+    max_workers: int = 4
+    database_name: str = 'UBRI_Publication'
@@ -0,0 +1,315 @@
+"""Sanity checks for the repository setup: dependencies, data and MongoDB."""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import mmap
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import orjson
+
+    # orjson parses in C and is several times faster than stdlib json on
+    # the string-heavy papers array; it takes the raw bytes directly.
+    _loads = orjson.loads
+except ImportError:
+    # json.loads builds a fresh JSONDecoder on every call; bind one
+    # decoder's decode method at module scope instead.
+    _JSON_DECODE = json.JSONDecoder().decode
+
+    def _loads(data):
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+        return _JSON_DECODE(data.decode('utf-8'))
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+# Same convention as the storage/retrieval scripts: deployment URI comes
+# from the environment, never from source, so CI can point the checks at
+# a local mongod.
+MONGODB_URI = os.environ.get('UBRI_MONGO_URI', 'mongodb://localhost:27017/')
+
+# Paths the checks look for, built once at import; shared so the checks
+# agree on what "the data" is.
+_DATA_JSON = Path('data/processed/mongodb_papers_clean.json')
+_PUBLICATIONS_DIR = Path('data/raw/Publications')
+_REQUIRED_PATHS = (_DATA_JSON, _PUBLICATIONS_DIR)
+
+# Handles cached by test_dependencies so later tests reuse them instead
+# of re-importing pymongo symbols.
+_MODS = {}
+
+# Per-path outcomes recorded by test_data_files so later checks can
+# reuse them instead of repeating the stat.
+_PATH_RESULTS = {}
+
+_client = None
+
+
+def get_client():
+    """Lazy module-wide MongoClient; the client *is* the connection pool.
+
+    Every test that talks to MongoDB shares this one handle, so the suite
+    performs a single handshake and server selection instead of one per
+    test.
+    """
+    global _client
+    if _client is None:
+        # Short timeouts: an unreachable server should fail the check in
+        # seconds, not pymongo's 30 s default server-selection wait.
+        _client = _MODS['MongoClient'](MONGODB_URI,
+                                       serverSelectionTimeoutMS=3000,
+                                       connectTimeoutMS=3000,
+                                       socketTimeoutMS=5000)
+        atexit.register(_client.close)
+    return _client
+
+
+def test_dependencies():
+    """Check that the heavyweight dependencies import."""
+    try:
+        import pymongo
+        from gridfs import GridFS
+        from pymongo import MongoClient
+        _MODS['MongoClient'] = MongoClient
+        _MODS['GridFS'] = GridFS
+        logger.info("✅ pymongo %s available", pymongo.version)
+        return True
+    except ImportError as e:
+        logger.error("❌ Missing dependency: %s", e)
+        return False
+
+
+def test_mongodb_connection(verbose=False):
+    """Check that MongoDB answers a ping round trip."""
+    if 'MongoClient' not in _MODS:
+        logger.error("❌ pymongo unavailable (dependency check failed)")
+        return False
+    try:
+        client = get_client()
+        # Liveness needs exactly one no-op round trip; touching a data
+        # collection would couple the check to collection state and pass
+        # or fail differently on an empty deployment.
+        client.admin.command('ping')
+        logger.info("✅ MongoDB server reachable")
+        if verbose:
+            db = client['UBRI_Publication']
+            file_count = db.pdf_files.files.estimated_document_count()
+            logger.info("   %s stored PDFs", file_count)
+        return True
+    except Exception as e:
+        logger.error("❌ MongoDB connection failed: %s", e)
+        return False
+
+
+def test_data_files():
+    """Check that the expected data files and directories exist."""
+    # One directory listing per parent instead of a stat per required
+    # path; membership checks against the listed names are free after
+    # that, however long the list grows.
+    by_parent = {}
+    for file_path in _REQUIRED_PATHS:
+        by_parent.setdefault(file_path.parent, []).append(file_path)
+    ok = True
+    for parent, paths in by_parent.items():
+        try:
+            names = set(os.listdir(parent))
+        except OSError:
+            names = set()
+        for file_path in paths:
+            found = file_path.name in names
+            _PATH_RESULTS[file_path] = found
+            if found:
+                logger.info("✅ %s exists", file_path)
+            else:
+                logger.error("❌ %s missing", file_path)
+                ok = False
+    return ok
+
+
+# str.endswith with a tuple handles the case variants scanned PDFs show
+# up with, without per-name lower() allocations or fnmatch translation.
+_PDF_SUFFIXES = ('.pdf', '.PDF')
+
+
+def _walk_pdfs(root):
+    """Yield PDF filenames under root using scandir's cached type info.
+
+    rglob('*.pdf') built a full list of Path objects and paid a stat per
+    entry; DirEntry type checks come from the directory read itself.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(_PDF_SUFFIXES):
+                    yield entry.name
+
+
+def test_pdf_files():
+    """Count the PDFs under the Publications tree."""
+    publications_dir = _PUBLICATIONS_DIR
+    # _run_checks runs test_data_files before this test, so its verdict
+    # is normally already recorded; the stat fallback only covers calling
+    # this function standalone.
+    known = _PATH_RESULTS.get(publications_dir)
+    if known is False or (known is None and not publications_dir.exists()):
+        logger.error("❌ Publications directory missing")
+        return False
+    count = 0
+    sample = None
+    for name in _walk_pdfs(publications_dir):
+        count += 1
+        if sample is None:
+            sample = name
+    logger.info("✅ Found %d PDF files", count)
+    if sample is not None:
+        logger.info("   sample: %s", sample)
+    return True
+
+
+def test_json_data():
+    """Parse the processed papers file and report basic counts."""
+    json_file = _DATA_JSON
+    if not json_file.exists():
+        logger.error("❌ %s missing", json_file)
+        return False
+    with open(json_file, 'rb') as f:
+        if ijson is not None:
+            # Walk the raw parse events and keep only the two fields the
+            # check reads; ijson.items still built a full dict per paper,
+            # including large pdf_content/abstract values this never
+            # looks at.
+            total = 0
+            pdf_count = 0
+            sample = None
+            file_found = False
+            title = None
+            for prefix, event, value in ijson.parse(f):
+                if event == 'start_map' and prefix == 'item':
+                    file_found = False
+                    title = None
+                elif prefix == 'item.file_found':
+                    file_found = bool(value)
+                elif prefix == 'item.title':
+                    title = value
+                elif event == 'end_map' and prefix == 'item':
+                    total += 1
+                    if file_found:
+                        pdf_count += 1
+                        if sample is None:
+                            sample = title
+        else:
+            # Map the file and hand the buffer straight to the parser;
+            # orjson consumes it without an intermediate read() copy.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                papers = _loads(memoryview(mm))
+            total = len(papers)
+            # Count and grab the first sample in one pass; the old list
+            # comprehension materialized every match just for len() and
+            # element zero.
+            pdf_count = 0
+            sample = None
+            for paper in papers:
+                if paper.get('file_found'):
+                    pdf_count += 1
+                    if sample is None:
+                        sample = paper.get('title')
+    logger.info("✅ %d papers, %d with PDFs", total, pdf_count)
+    if sample is not None:
+        logger.info("   sample: %s", sample)
+    return True
+
+
+def _run_test(name, test_func):
+    try:
+        return test_func()
+    except Exception as e:
+        logger.error("❌ %s crashed: %s", name, e)
+        return False
+
+
+def _run_checks():
+    tests = [
+        ('Dependencies', test_dependencies),
+        ('MongoDB Connection', test_mongodb_connection),
+        ('Data Files', test_data_files),
+        ('PDF Files', test_pdf_files),
+        ('JSON Data', test_json_data),
+    ]
+    # Tests whose failure makes a later test pointless; the dependent is
+    # marked failed without running, which avoids waiting out the Mongo
+    # server-selection timeout when pymongo is not even importable.
+    skip_if = {'MongoDB Connection': 'Dependencies'}
+    # Near-instant local checks that later tests depend on, run
+    # sequentially before the pool: Dependencies gates the MongoDB check,
+    # and Data Files must have populated _PATH_RESULTS before the PDF
+    # check reads it — submitting both to the pool at once let the PDF
+    # check race ahead and fall back to its own stat every run.
+    upfront = ('Dependencies', 'Data Files')
+    results = {}
+
+    by_name = dict(tests)
+    for name in upfront:
+        results[name] = _run_test(name, by_name[name])
+
+    runnable = []
+    for name, test_func in tests:
+        if name in upfront:
+            continue
+        prerequisite = skip_if.get(name)
+        if prerequisite is not None and not results.get(prerequisite, True):
+            logger.warning("--- %s skipped (%s failed) ---", name, prerequisite)
+            results[name] = False
+        else:
+            runnable.append((name, test_func))
+
+    # The remaining checks are independent and I/O-bound (MongoDB round
+    # trip, filesystem walk, JSON parse), so overlap them in threads;
+    # wall time becomes the slowest check instead of the sum. Each test
+    # writes only its own results entry after its future completes.
+    with ThreadPoolExecutor(max_workers=max(1, len(runnable))) as executor:
+        futures = {name: executor.submit(_run_test, name, test_func)
+                   for name, test_func in runnable}
+        for name, future in futures.items():
+            results[name] = future.result()
+    passed = sum(results.values())
+    logger.info("%d/%d checks passed", passed, len(results))
+    return 0 if passed == len(results) else 1
+
+
+def main():
+    # Buffer the INFO chatter and flush it once at the end: each of the
+    # ~30 immediate emits acquires the handler lock, writes and flushes,
+    # which dominates wall time when stderr is a slow CI pipe. WARNING
+    # and above flush the buffer immediately, so failures still appear
+    # as they happen.
+    root = logging.getLogger()
+    targets = root.handlers[:]
+    buffered = [logging.handlers.MemoryHandler(capacity=256,
+                                               flushLevel=logging.WARNING,
+                                               target=target)
+                for target in targets]
+    root.handlers = buffered
+    try:
+        return _run_checks()
+    finally:
+        for handler in buffered:
+            handler.close()
+        root.handlers = targets
+
+
+if __name__ == '__main__':
+    sys.exit(main())